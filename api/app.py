@@ -1,6 +1,7 @@
 from fastapi import FastAPI
 from api.models.api_request import ApiRequest
-from api.modules import handle_s1_vh_mask, handle_s2_ndwi_mask, handle_s2_mndwi_mask, handle_grid_ndwi, handle_grid_mndwi
+from api.models.result_query import ResultQuery
+from api.modules import handle_s1_vh_mask, handle_s2_ndwi_mask, handle_s2_mndwi_mask, handle_grid_ndwi, handle_grid_mndwi, handle_query_results
 
 app = FastAPI()
 
@@ -26,3 +27,10 @@ async def process_mndwi_grid(request: ApiRequest):
     Process the area as a grid using MNDWI water detection
     """
     return await handle_grid_mndwi(request)
+
+@app.post("/query-results")
+async def query_stored_results(query: ResultQuery):
+    """
+    Query stored mask and grid results by bounding box, date range and index
+    """
+    return await handle_query_results(query)
@@ -0,0 +1,25 @@
+def get_bounds(coordinates):
+    """
+    Compute the bounding box of an area's coordinates.
+
+    Args:
+        coordinates: List of [lon, lat] points, or a ring-nested list
+            ([[[lon, lat], ...]]) as accepted by ee.Geometry.Polygon,
+            in which case the outer ring is used
+
+    Returns:
+        tuple: (min_lon, min_lat, max_lon, max_lat)
+    """
+    if coordinates and coordinates[0] and isinstance(coordinates[0][0], (list, tuple)):
+        coordinates = coordinates[0]
+
+    try:
+        lons = [float(coord[0]) for coord in coordinates]
+        lats = [float(coord[1]) for coord in coordinates]
+    except (TypeError, ValueError, IndexError):
+        raise ValueError("Invalid coordinates. Expected a list of [lon, lat] points.")
+
+    if not lons:
+        raise ValueError("Invalid coordinates. Expected a list of [lon, lat] points.")
+
+    return min(lons), min(lats), max(lons), max(lats)
@@ -0,0 +1,195 @@
+import json
+import os
+import sqlite3
+from contextlib import closing
+from datetime import date, datetime, timezone
+from api.helpers.bounds import get_bounds
+from config.init_config import RESULT_STORE_PATH
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    product TEXT NOT NULL,
+    index_name TEXT NOT NULL,
+    threshold REAL,
+    start_date TEXT NOT NULL,
+    end_date TEXT NOT NULL,
+    min_lon REAL NOT NULL,
+    min_lat REAL NOT NULL,
+    max_lon REAL NOT NULL,
+    max_lat REAL NOT NULL,
+    stored_at TEXT NOT NULL,
+    geojson TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_index_dates
+    ON results (index_name, start_date, end_date);
+CREATE UNIQUE INDEX IF NOT EXISTS results_unique_key
+    ON results (product, index_name, IFNULL(threshold, 'none'), start_date, end_date,
+                min_lon, min_lat, max_lon, max_lat);
+CREATE VIRTUAL TABLE IF NOT EXISTS results_bounds
+    USING rtree(id, min_lon, max_lon, min_lat, max_lat);
+"""
+
+def _connect(db_path=None):
+    """Open the result store, creating the database and tables if needed."""
+    db_path = db_path or RESULT_STORE_PATH
+    directory = os.path.dirname(db_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    conn = sqlite3.connect(db_path)
+    conn.executescript(SCHEMA)
+    return conn
+
+def normalize_date(value) -> str:
+    """
+    Normalize a date to 'YYYY-MM-DD' so stored ranges compare correctly as text.
+
+    Accepts ISO dates ('2024-05-10') and unpadded dates ('2024-5-1').
+    Values with a time component are rejected, since truncating them would
+    map different Earth Engine time windows to the same stored result.
+    """
+    if isinstance(value, datetime):
+        raise ValueError(f"Invalid date '{value}'. Expected YYYY-MM-DD without a time.")
+    if isinstance(value, date):
+        return value.isoformat()
+
+    try:
+        return date.fromisoformat(value).isoformat()
+    except (TypeError, ValueError):
+        pass
+
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date().isoformat()
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid date '{value}'. Expected YYYY-MM-DD without a time.")
+
+def store_result(geojson_data: dict, product, index_name, coordinates, start_date, end_date,
+                 threshold=None, db_path=None) -> int:
+    """Persist a mask or grid result, indexed by its bounds and date range.
+
+    Repeating a request with the same product, index, threshold, dates and
+    bounds replaces the stored result instead of adding a new one.
+
+    Args:
+        geojson_data: The GeoJSON result returned to the client
+        product: Kind of result ('mask' or 'grid')
+        index_name: Water index used ('NDWI', 'MNDWI' or 'VH_dB')
+        coordinates: List of coordinates defining the requested area
+        start_date: Start date (YYYY-MM-DD)
+        end_date: End date (YYYY-MM-DD)
+        threshold: Threshold used for water classification
+        db_path: Optional database path (defaults to RESULT_STORE_PATH)
+
+    Returns:
+        int: The id of the stored result
+    """
+    min_lon, min_lat, max_lon, max_lat = get_bounds(coordinates)
+    start_date = normalize_date(start_date)
+    end_date = normalize_date(end_date)
+    stored_at = datetime.now(timezone.utc).isoformat()
+    geojson_text = json.dumps(geojson_data)
+
+    with closing(_connect(db_path)) as conn, conn:
+        # The unique index makes concurrent stores of the same result update one row
+        conn.execute(
+            "INSERT INTO results (product, index_name, threshold, start_date, end_date, "
+            "min_lon, min_lat, max_lon, max_lat, stored_at, geojson) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (product, index_name, IFNULL(threshold, 'none'), start_date, end_date, "
+            "min_lon, min_lat, max_lon, max_lat) "
+            "DO UPDATE SET stored_at = excluded.stored_at, geojson = excluded.geojson",
+            (product, index_name, threshold, start_date, end_date,
+             min_lon, min_lat, max_lon, max_lat, stored_at, geojson_text)
+        )
+        result_id = conn.execute(
+            "SELECT id FROM results "
+            "WHERE product = ? AND index_name = ? AND IFNULL(threshold, 'none') = IFNULL(?, 'none') "
+            "AND start_date = ? AND end_date = ? "
+            "AND min_lon = ? AND min_lat = ? AND max_lon = ? AND max_lat = ?",
+            (product, index_name, threshold, start_date, end_date, min_lon, min_lat, max_lon, max_lat)
+        ).fetchone()[0]
+        conn.execute(
+            "INSERT OR REPLACE INTO results_bounds (id, min_lon, max_lon, min_lat, max_lat) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (result_id, min_lon, max_lon, min_lat, max_lat)
+        )
+
+    return result_id
+
+def query_results(bbox, start_date, end_date, index_name=None, product=None, limit=None,
+                  include_geojson=True, db_path=None) -> list:
+    """Find stored results intersecting a bounding box and overlapping a date range.
+
+    Args:
+        bbox: Bounding box as [min_lon, min_lat, max_lon, max_lat]
+        start_date: Start of the queried range (YYYY-MM-DD, inclusive)
+        end_date: End of the queried range (YYYY-MM-DD, exclusive like Earth Engine's filterDate)
+        index_name: Optional water index filter ('NDWI', 'MNDWI' or 'VH_dB')
+        product: Optional result kind filter ('mask' or 'grid')
+        limit: Optional maximum number of results to return
+        include_geojson: Whether to include the stored GeoJSON or only metadata
+        db_path: Optional database path (defaults to RESULT_STORE_PATH)
+
+    Returns:
+        list: Stored results (metadata and GeoJSON), most recent first
+    """
+    min_lon, min_lat, max_lon, max_lat = bbox
+    if min_lon > max_lon or min_lat > max_lat:
+        raise ValueError("Invalid bbox. Expected [min_lon, min_lat, max_lon, max_lat].")
+
+    start_date = normalize_date(start_date)
+    end_date = normalize_date(end_date)
+    if start_date >= end_date:
+        raise ValueError("Invalid date range. end_date must be after start_date.")
+
+    # The R-tree narrows candidates by bounds (stored as widened float32), the exact
+    # bounds check removes false positives and the date index handles the rest.
+    # Stored and queried ranges are both half-open: [start_date, end_date)
+    columns = "r.id, r.product, r.index_name, r.threshold, r.start_date, r.end_date, " \
+              "r.min_lon, r.min_lat, r.max_lon, r.max_lat, r.stored_at"
+    if include_geojson:
+        columns += ", r.geojson"
+
+    sql = (
+        f"SELECT {columns} "
+        "FROM results_bounds b JOIN results r ON r.id = b.id "
+        "WHERE b.max_lon >= ? AND b.min_lon <= ? AND b.max_lat >= ? AND b.min_lat <= ? "
+        "AND r.max_lon >= ? AND r.min_lon <= ? AND r.max_lat >= ? AND r.min_lat <= ? "
+        "AND r.start_date < ? AND r.end_date > ?"
+    )
+    bounds = [min_lon, max_lon, min_lat, max_lat]
+    params = bounds + bounds + [end_date, start_date]
+
+    if index_name is not None:
+        sql += " AND r.index_name = ?"
+        params.append(index_name)
+    if product is not None:
+        sql += " AND r.product = ?"
+        params.append(product)
+
+    sql += " ORDER BY r.stored_at DESC"
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(limit)
+
+    with closing(_connect(db_path)) as conn:
+        rows = conn.execute(sql, params).fetchall()
+
+    results = []
+    for row in rows:
+        result = {
+            "id": row[0],
+            "product": row[1],
+            "index_name": row[2],
+            "threshold": row[3],
+            "start_date": row[4],
+            "end_date": row[5],
+            "bbox": [row[6], row[7], row[8], row[9]],
+            "stored_at": row[10],
+        }
+        if include_geojson:
+            result["result"] = json.loads(row[11])
+        results.append(result)
+
+    return results
@@ -0,0 +1,11 @@
+from typing import Literal, Optional, Tuple
+from pydantic import BaseModel, Field
+
+class ResultQuery(BaseModel):
+    bbox: Tuple[float, float, float, float]
+    start_date: str
+    end_date: str
+    index_name: Optional[Literal["NDWI", "MNDWI", "VH_dB"]] = None
+    product: Optional[Literal["mask", "grid"]] = None
+    limit: int = Field(default=100, gt=0, le=1000)
+    include_geojson: bool = True
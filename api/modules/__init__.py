@@ -1,3 +1,3 @@
-from .request_handlers import handle_s1_vh_mask, handle_s2_ndwi_mask, handle_s2_mndwi_mask, handle_grid_ndwi, handle_grid_mndwi
+from .request_handlers import handle_s1_vh_mask, handle_s2_ndwi_mask, handle_s2_mndwi_mask, handle_grid_ndwi, handle_grid_mndwi, handle_query_results
 
-__all__ = ['handle_s1_vh_mask', 'handle_s2_ndwi_mask', 'handle_s2_mndwi_mask', 'handle_grid_ndwi', 'handle_grid_mndwi']
\ No newline at end of file
+__all__ = ['handle_s1_vh_mask', 'handle_s2_ndwi_mask', 'handle_s2_mndwi_mask', 'handle_grid_ndwi', 'handle_grid_mndwi', 'handle_query_results']
\ No newline at end of file
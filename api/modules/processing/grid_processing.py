@@ -1,4 +1,5 @@
 import ee
+from api.helpers.bounds import get_bounds
 from api.modules.processing.water_detection import detect_water_ndwi, detect_water_mndwi
 from api.modules.processing.water_coverage import calculate_water_coverage
 from api.modules.processing.geojson_format import convert_water_mask_to_geojson
@@ -15,10 +16,7 @@ def create_grid_cells(coordinates, cell_size_degrees=0.1):
         List of cell coordinates
     """
     # Get bounding box of input coordinates
-    lons = [coord[0] for coord in coordinates]
-    lats = [coord[1] for coord in coordinates]
-    min_lon, max_lon = min(lons), max(lons)
-    min_lat, max_lat = min(lats), max(lats)
+    min_lon, min_lat, max_lon, max_lat = get_bounds(coordinates)
     
     # Create grid cells
     cells = []
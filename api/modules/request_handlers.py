@@ -1,10 +1,20 @@
 from fastapi import HTTPException
 from api.models.api_request import ApiRequest
+from api.models.result_query import ResultQuery
 from api.modules.processing.water_detection import detect_water_radar, detect_water_ndwi, detect_water_mndwi
 from api.modules.processing.geojson_format import convert_radar_water_to_geojson, convert_optical_ndwi_to_geojson, convert_optical_mndwi_to_geojson
 from api.modules.processing.grid_processing import process_grid
 from config.init_config import logger
 from api.helpers.save_geojson import save_geojson
+from api.helpers.result_store import store_result, query_results
+
+def store_result_safely(geojson_data, product, index_name, request: ApiRequest, threshold):
+    """Store a computed result without letting store failures discard it."""
+    try:
+        store_result(geojson_data, product, index_name, request.coordinates,
+                     request.start_date, request.end_date, threshold=threshold)
+    except Exception as e:
+        logger.warning("Could not store %s %s result: %s", index_name, product, str(e))
 
 async def handle_s1_vh_mask(request: ApiRequest):
     try:
@@ -20,6 +30,7 @@ async def handle_s1_vh_mask(request: ApiRequest):
         water_mask_geojson = convert_radar_water_to_geojson(flood_mask, vh_mean, request.coordinates,
                                             request.start_date, request.end_date)
         # save_geojson(water_mask_geojson, "./data/s1_vh_water_mask.geojson")
+        store_result_safely(water_mask_geojson, "mask", "VH_dB", request, request.vh_threshold)
         logger.info("Computed water mask successfully.")
         return water_mask_geojson
 
@@ -42,6 +53,7 @@ async def handle_s2_ndwi_mask(request: ApiRequest):
                                                 request.start_date, request.end_date)
         
         # save_geojson(water_mask_geojson, "./data/ndwi_water_mask.geojson")
+        store_result_safely(water_mask_geojson, "mask", "NDWI", request, request.ndwi_threshold)
         logger.info("Computed water mask successfully.")
         return water_mask_geojson
 
@@ -64,6 +76,7 @@ async def handle_s2_mndwi_mask(request: ApiRequest):
                                                 request.start_date, request.end_date)
         
         # save_geojson(water_mask_geojson, "./data/mndwi_water_mask.geojson")
+        store_result_safely(water_mask_geojson, "mask", "MNDWI", request, request.mndwi_threshold)
         logger.info("Computed water mask successfully.")
         return water_mask_geojson
 
@@ -86,6 +99,7 @@ async def handle_grid_ndwi(request: ApiRequest):
 
         # Save the grid data if needed
         # save_geojson(grid_data, "./data/grid_ndwi_data.geojson")
+        store_result_safely(grid_data, "grid", "NDWI", request, request.ndwi_threshold)
         
         logger.info("Computed grid data successfully.")
         return grid_data
@@ -110,10 +124,38 @@ async def handle_grid_mndwi(request: ApiRequest):
 
         # Save the grid data if needed
         # save_geojson(grid_data, "./data/grid_mndwi_data.geojson")
+        store_result_safely(grid_data, "grid", "MNDWI", request, request.mndwi_threshold)
         
         logger.info("Computed MNDWI grid data successfully.")
         return grid_data
 
+    except Exception as e:
+        logger.error("An error occurred: %s", str(e))
+        raise HTTPException(status_code=500, detail=str(e))
+
+async def handle_query_results(query: ResultQuery):
+    try:
+        logger.info("Received stored results query: %s", query)
+
+        results = query_results(
+            bbox=query.bbox,
+            start_date=query.start_date,
+            end_date=query.end_date,
+            index_name=query.index_name,
+            product=query.product,
+            limit=query.limit,
+            include_geojson=query.include_geojson
+        )
+
+        logger.info("Found %d stored results.", len(results))
+        return {
+            "results": results,
+            "total_results": len(results)
+        }
+
+    except ValueError as e:
+        logger.error("Invalid query: %s", str(e))
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error("An error occurred: %s", str(e))
         raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
@@ -1,3 +1,3 @@
-from .init_config import init_gee, init_logging, logger
+from .init_config import init_gee, init_logging, logger, RESULT_STORE_PATH
 
-__all__ = ["init_gee", "init_logging", "logger"]
\ No newline at end of file
+__all__ = ["init_gee", "init_logging", "logger", "RESULT_STORE_PATH"]
\ No newline at end of file
@@ -1,5 +1,9 @@
 import ee
 import logging
+import os
+
+# Location of the SQLite store for computed results
+RESULT_STORE_PATH = os.environ.get("RESULT_STORE_PATH", "./data/results.sqlite")
 
 # Initialize GEE
 def init_gee():
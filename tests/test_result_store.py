@@ -0,0 +1,118 @@
+import asyncio
+import pytest
+from fastapi import HTTPException
+from api.helpers import result_store
+from api.helpers.bounds import get_bounds
+from api.helpers.result_store import store_result, query_results
+from api.models.result_query import ResultQuery
+from api.modules import handle_query_results
+
+AREA = [[23.6, 45.1], [24.0, 45.1], [24.0, 45.5], [23.6, 45.5], [23.6, 45.1]]
+BBOX = [23.5, 45.0, 24.5, 46.0]
+GEOJSON = {"type": "FeatureCollection", "features": []}
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "results.sqlite")
+
+def test_store_then_query(db_path):
+    result_id = store_result(GEOJSON, "mask", "NDWI", AREA, "2024-05-01", "2024-05-10",
+                             threshold=0.0, db_path=db_path)
+
+    results = query_results(BBOX, "2024-05-05", "2024-05-31", db_path=db_path)
+
+    assert [r["id"] for r in results] == [result_id]
+    assert results[0]["result"] == GEOJSON
+    assert results[0]["bbox"] == [23.6, 45.1, 24.0, 45.5]
+
+def test_ring_nested_coordinates(db_path):
+    assert get_bounds([AREA]) == get_bounds(AREA)
+    store_result(GEOJSON, "mask", "NDWI", [AREA], "2024-05-01", "2024-05-10", db_path=db_path)
+
+    assert len(query_results(BBOX, "2024-05-01", "2024-05-10", db_path=db_path)) == 1
+
+def test_bbox_outside_area(db_path):
+    store_result(GEOJSON, "mask", "NDWI", AREA, "2024-05-01", "2024-05-10", db_path=db_path)
+
+    assert query_results([30.0, 50.0, 31.0, 51.0], "2024-05-01", "2024-05-10", db_path=db_path) == []
+
+def test_bbox_just_outside_area(db_path):
+    # The R-tree widens float32 bounds outward, so this bbox still hits it
+    store_result(GEOJSON, "mask", "NDWI", AREA, "2024-05-01", "2024-05-10", db_path=db_path)
+
+    assert query_results([23.0, 45.0, 23.59999999, 46.0], "2024-05-01", "2024-05-10", db_path=db_path) == []
+    assert len(query_results([23.0, 45.0, 23.6, 46.0], "2024-05-01", "2024-05-10", db_path=db_path)) == 1
+
+def test_date_ranges_touching_at_edge(db_path):
+    # End dates are exclusive, as in Earth Engine's filterDate
+    store_result(GEOJSON, "mask", "NDWI", AREA, "2024-05-01", "2024-05-10", db_path=db_path)
+
+    assert query_results(BBOX, "2024-05-10", "2024-05-20", db_path=db_path) == []
+    assert query_results(BBOX, "2024-04-20", "2024-05-01", db_path=db_path) == []
+    assert len(query_results(BBOX, "2024-05-09", "2024-05-20", db_path=db_path)) == 1
+    assert len(query_results(BBOX, "2024-04-20", "2024-05-02", db_path=db_path)) == 1
+
+def test_dates_are_normalized(db_path):
+    store_result(GEOJSON, "mask", "NDWI", AREA, "2024-5-1", "2024-05-10", db_path=db_path)
+
+    results = query_results(BBOX, "2024-5-1", "2024-5-2", db_path=db_path)
+
+    assert [(r["start_date"], r["end_date"]) for r in results] == [("2024-05-01", "2024-05-10")]
+
+def test_dates_with_time_are_rejected(db_path):
+    with pytest.raises(ValueError):
+        store_result(GEOJSON, "mask", "NDWI", AREA, "2024-05-01", "2024-05-10T12:00", db_path=db_path)
+    with pytest.raises(ValueError):
+        query_results(BBOX, "2024-05-01T00:00", "2024-05-10", db_path=db_path)
+
+def test_index_and_product_filters(db_path):
+    store_result(GEOJSON, "mask", "NDWI", AREA, "2024-05-01", "2024-05-10", db_path=db_path)
+    store_result(GEOJSON, "grid", "MNDWI", AREA, "2024-05-01", "2024-05-10", db_path=db_path)
+
+    ndwi = query_results(BBOX, "2024-05-01", "2024-05-10", index_name="NDWI", db_path=db_path)
+    grids = query_results(BBOX, "2024-05-01", "2024-05-10", product="grid", db_path=db_path)
+
+    assert [(r["product"], r["index_name"]) for r in ndwi] == [("mask", "NDWI")]
+    assert [(r["product"], r["index_name"]) for r in grids] == [("grid", "MNDWI")]
+    assert query_results(BBOX, "2024-05-01", "2024-05-10", index_name="NDWI", product="grid",
+                         db_path=db_path) == []
+
+def test_repeated_result_is_replaced(db_path):
+    first_id = store_result(GEOJSON, "mask", "NDWI", AREA, "2024-05-01", "2024-05-10",
+                            threshold=0.0, db_path=db_path)
+    updated = {"type": "FeatureCollection", "features": [{"type": "Feature"}]}
+    second_id = store_result(updated, "mask", "NDWI", AREA, "2024-05-01", "2024-05-10",
+                             threshold=0.0, db_path=db_path)
+
+    results = query_results(BBOX, "2024-05-01", "2024-05-10", db_path=db_path)
+
+    assert first_id == second_id
+    assert len(results) == 1
+    assert results[0]["result"] == updated
+
+def test_repeated_result_without_threshold_is_replaced(db_path):
+    first_id = store_result(GEOJSON, "grid", "NDWI", AREA, "2024-05-01", "2024-05-10", db_path=db_path)
+    second_id = store_result(GEOJSON, "grid", "NDWI", AREA, "2024-05-01", "2024-05-10", db_path=db_path)
+
+    assert first_id == second_id
+    assert len(query_results(BBOX, "2024-05-01", "2024-05-10", db_path=db_path)) == 1
+
+def test_limit_and_metadata_only(db_path):
+    for threshold in (0.0, 0.1, 0.2):
+        store_result(GEOJSON, "mask", "NDWI", AREA, "2024-05-01", "2024-05-10",
+                     threshold=threshold, db_path=db_path)
+
+    results = query_results(BBOX, "2024-05-01", "2024-05-10", limit=2, include_geojson=False,
+                            db_path=db_path)
+
+    assert len(results) == 2
+    assert all("result" not in r for r in results)
+
+def test_invalid_bbox_returns_400(db_path, monkeypatch):
+    monkeypatch.setattr(result_store, "RESULT_STORE_PATH", db_path)
+    query = ResultQuery(bbox=[24.5, 45.0, 23.5, 46.0], start_date="2024-05-01", end_date="2024-05-10")
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(handle_query_results(query))
+
+    assert exc_info.value.status_code == 400